@@ -36,6 +36,25 @@ from metadataserver.models.script import (
 )
 from provisioningserver.events import EVENT_TYPES
 
+# Delimits the embedded YAML metadata in a script.
+YAML_DELIM_REGEX = re.compile(
+    r"\s*#\s*-+\s*(Start|End) MAAS (?P<version>\d+\.\d+) "
+    r"script metadata\s+-+",
+    re.I,
+)
+
+# Hardware identifiers accepted by for_hardware.
+FOR_HARDWARE_REGEX = re.compile(
+    r"^modalias:.+|pci:[\da-f]{4}:[\da-f]{4}|"
+    r"usb:[\da-f]{4}:[\da-f]{4}|"
+    r"system_vendor:.*|"
+    r"system_product:.*|"
+    r"system_version:.*|"
+    r"mainboard_vendor:.*|"
+    r"mainboard_product:.*$",
+    re.I,
+)
+
 
 class ScriptForm(ModelForm):
 
@@ -278,11 +297,6 @@ class ScriptForm(ModelForm):
         read the values. Leading '#' are ignored. If the values are
         fields they will be entered in the form.
         """
-        yaml_delim = re.compile(
-            r"\s*#\s*-+\s*(Start|End) MAAS (?P<version>\d+\.\d+) "
-            r"script metadata\s+-+",
-            re.I,
-        )
         found_version = None
         yaml_content = ""
 
@@ -301,7 +315,7 @@ class ScriptForm(ModelForm):
             set_form_error(self, "script", "Must start with shebang.")
 
         for line in script_splitlines[1:]:
-            m = yaml_delim.search(line)
+            m = YAML_DELIM_REGEX.search(line)
             if m is not None:
                 if found_version is None and m.group("version") == "1.0":
                     # Found the start of the embedded YAML
@@ -404,18 +418,8 @@ class ScriptForm(ModelForm):
         if not isinstance(for_hardware, list):
             set_form_error(self, "for_hardware", "Must be a list or string")
             return
-        regex = re.compile(
-            r"^modalias:.+|pci:[\da-f]{4}:[\da-f]{4}|"
-            r"usb:[\da-f]{4}:[\da-f]{4}|"
-            r"system_vendor:.*|"
-            r"system_product:.*|"
-            r"system_version:.*|"
-            r"mainboard_vendor:.*|"
-            r"mainboard_product:.*$",
-            re.I,
-        )
         for hw_id in for_hardware:
-            if regex.search(hw_id) is None:
+            if FOR_HARDWARE_REGEX.search(hw_id) is None:
                 set_form_error(
                     self,
                     "for_hardware",
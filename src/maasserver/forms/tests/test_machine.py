@@ -35,6 +35,9 @@ from provisioningserver.testing.os import make_osystem
 
 class TestMachineForm(MAASServerTestCase):
     def test_contains_limited_set_of_fields(self):
+        # The field list does not depend on which architectures are usable,
+        # so skip querying boot resources for them.
+        patch_usable_architectures(self, [])
         form = MachineForm()
 
         self.assertItemsEqual(
@@ -72,7 +75,7 @@ class TestMachineForm(MAASServerTestCase):
             }
         )
         self.assertFalse(form.is_valid())
-        self.assertItemsEqual(["architecture"], form._errors.keys())
+        self.assertEqual({"architecture"}, set(form._errors))
 
     def test_starts_with_default_architecture(self):
         arches = sorted([factory.make_name("arch") for _ in range(5)])
@@ -139,7 +142,7 @@ class TestMachineForm(MAASServerTestCase):
             instance=node,
         )
         self.assertFalse(form.is_valid())
-        self.assertItemsEqual(["osystem"], form._errors.keys())
+        self.assertEqual({"osystem"}, set(form._errors))
 
     def test_starts_with_default_osystem(self):
         user = factory.make_User()
@@ -183,7 +186,7 @@ class TestMachineForm(MAASServerTestCase):
             instance=node,
         )
         self.assertFalse(form.is_valid())
-        self.assertItemsEqual(["distro_series"], form._errors.keys())
+        self.assertEqual({"distro_series"}, set(form._errors))
 
     def test_set_distro_series_accepts_short_distro_series(self):
         user = factory.make_User()
@@ -245,7 +248,7 @@ class TestMachineForm(MAASServerTestCase):
             instance=node,
         )
         self.assertFalse(form.is_valid())
-        self.assertItemsEqual(["distro_series"], form._errors.keys())
+        self.assertEqual({"distro_series"}, set(form._errors))
 
     def test_rejects_when_validate_license_key_returns_False(self):
         user = factory.make_User()
@@ -270,7 +273,7 @@ class TestMachineForm(MAASServerTestCase):
             instance=node,
         )
         self.assertFalse(form.is_valid())
-        self.assertItemsEqual(["license_key"], form._errors.keys())
+        self.assertEqual({"license_key"}, set(form._errors))
 
     def test_rejects_when_validate_license_key_for_returns_False(self):
         user = factory.make_User()
@@ -294,7 +297,7 @@ class TestMachineForm(MAASServerTestCase):
             instance=node,
         )
         self.assertFalse(form.is_valid())
-        self.assertItemsEqual(["license_key"], form._errors.keys())
+        self.assertEqual({"license_key"}, set(form._errors))
 
     def test_rejects_when_validate_license_key_for_raise_no_connection(self):
         user = factory.make_User()
@@ -318,7 +321,7 @@ class TestMachineForm(MAASServerTestCase):
             instance=node,
         )
         self.assertFalse(form.is_valid())
-        self.assertItemsEqual(["license_key"], form._errors.keys())
+        self.assertEqual({"license_key"}, set(form._errors))
 
     def test_rejects_when_validate_license_key_for_raise_timeout(self):
         user = factory.make_User()
@@ -342,7 +345,7 @@ class TestMachineForm(MAASServerTestCase):
             instance=node,
         )
         self.assertFalse(form.is_valid())
-        self.assertItemsEqual(["license_key"], form._errors.keys())
+        self.assertEqual({"license_key"}, set(form._errors))
 
     def test_rejects_when_validate_license_key_for_raise_no_os(self):
         user = factory.make_User()
@@ -366,7 +369,7 @@ class TestMachineForm(MAASServerTestCase):
             instance=node,
         )
         self.assertFalse(form.is_valid())
-        self.assertItemsEqual(["license_key"], form._errors.keys())
+        self.assertEqual({"license_key"}, set(form._errors))
 
 
 class TestAdminMachineForm(MAASServerTestCase):
@@ -374,6 +377,7 @@ class TestAdminMachineForm(MAASServerTestCase):
         user = factory.make_User()
         self.client.login(user=user)
         node = factory.make_Node(owner=user)
+        patch_usable_architectures(self, [])
         form = AdminMachineForm(instance=node)
 
         self.assertItemsEqual(
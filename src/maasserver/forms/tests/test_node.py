@@ -6,13 +6,8 @@
 __all__ = []
 
 from maasserver.forms import AdminNodeForm, NodeForm
-from maasserver.testing.architecture import (
-    make_usable_architecture,
-    patch_usable_architectures,
-)
 from maasserver.testing.factory import factory
 from maasserver.testing.testcase import MAASServerTestCase
-from maasserver.utils.orm import reload_object
 
 
 class TestNodeForm(MAASServerTestCase):
@@ -27,15 +22,8 @@ class TestNodeForm(MAASServerTestCase):
     def test_accepts_hostname(self):
         machine = factory.make_Node()
         hostname = factory.make_string()
-        patch_usable_architectures(self, [machine.architecture])
 
-        form = NodeForm(
-            data={
-                "hostname": hostname,
-                "architecture": make_usable_architecture(self),
-            },
-            instance=machine,
-        )
+        form = NodeForm(data={"hostname": hostname}, instance=machine)
         form.save()
 
         self.assertEqual(hostname, machine.hostname)
@@ -43,7 +31,6 @@ class TestNodeForm(MAASServerTestCase):
     def test_accepts_domain_by_name(self):
         machine = factory.make_Node()
         domain = factory.make_Domain()
-        patch_usable_architectures(self, [machine.architecture])
 
         form = NodeForm(data={"domain": domain.name}, instance=machine)
         form.save()
@@ -53,7 +40,6 @@ class TestNodeForm(MAASServerTestCase):
     def test_accepts_domain_by_id(self):
         machine = factory.make_Node()
         domain = factory.make_Domain()
-        patch_usable_architectures(self, [machine.architecture])
 
         form = NodeForm(data={"domain": domain.id}, instance=machine)
         form.save()
@@ -62,7 +48,6 @@ class TestNodeForm(MAASServerTestCase):
 
     def test_validates_domain(self):
         machine = factory.make_Node()
-        patch_usable_architectures(self, [machine.architecture])
 
         form = NodeForm(
             data={"domain": factory.make_name("domain")}, instance=machine
@@ -71,22 +56,12 @@ class TestNodeForm(MAASServerTestCase):
         self.assertFalse(form.is_valid())
 
     def test_accepts_disable_ipv4_if_false(self):
-        form = NodeForm(
-            data={
-                "architecture": make_usable_architecture(self),
-                "disable_ipv4": False,
-            }
-        )
+        form = NodeForm(data={"disable_ipv4": False})
         form.save()
         # The field does not get to the model.
 
     def test_rejects_disable_ipv4_if_true(self):
-        form = NodeForm(
-            data={
-                "architecture": make_usable_architecture(self),
-                "disable_ipv4": True,
-            }
-        )
+        form = NodeForm(data={"disable_ipv4": True})
         self.assertFalse(form.is_valid())
 
 
@@ -132,15 +107,9 @@ class TestAdminNodeForm(MAASServerTestCase):
         zone = factory.make_Zone()
         hostname = factory.make_string()
         form = AdminNodeForm(
-            data={
-                "hostname": hostname,
-                "architecture": make_usable_architecture(self),
-                "zone": zone.name,
-            },
-            instance=node,
+            data={"hostname": hostname, "zone": zone.name}, instance=node
         )
-        form.save()
+        node = form.save()
 
-        node = reload_object(node)
         self.assertEqual(node.hostname, hostname)
         self.assertEqual(node.zone, zone)
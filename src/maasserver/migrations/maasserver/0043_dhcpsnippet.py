@@ -56,10 +56,6 @@ class Migration(migrations.Migration):
                 ),
             ],
             options={"abstract": False},
-            bases=(
-                maasserver.models.cleansave.CleanSave,
-                models.Model,
-                object,
-            ),
+            bases=(maasserver.models.cleansave.CleanSave, models.Model),
         )
     ]
@@ -274,11 +274,6 @@ class IPRange(CleanSave, TimestampedModel):
             message += "IP address or range."
 
         # Find unused range for start_ip
-        for range in unused:
-            if IPAddress(self.start_ip) in range:
-                if IPAddress(self.end_ip) in range:
-                    # Success, start and end IP are in an unused range.
-                    return
-                else:
-                    self._raise_validation_error(message)
-        self._raise_validation_error(message)
+        range = unused.find(self.start_ip)
+        if range is None or IPAddress(self.end_ip) not in range:
+            self._raise_validation_error(message)
@@ -17,10 +17,8 @@ __all__ = [
     "FabricHandler",
     "GeneralHandler",
     "IPRangeHandler",
-    "IPRangeHandler",
     "MachineHandler",
     "NodeResultHandler",
-    "NodeResultHandler",
     "NotificationHandler",
     "PackageRepositoryHandler",
     "PodHandler",
@@ -0,0 +1,40 @@
+# Copyright 2019 Canonical Ltd.  This software is licensed under the
+# GNU Affero General Public License version 3 (see the file LICENSE).
+
+"""Tests for `maasserver.websockets.handlers`."""
+
+__all__ = []
+
+from importlib import import_module
+from inspect import isclass
+from pkgutil import iter_modules
+
+from maasserver.websockets import handlers
+from maasserver.websockets.base import Handler
+from maastesting.testcase import MAASTestCase
+
+
+class TestHandlersAll(MAASTestCase):
+    def test_has_no_duplicates(self):
+        self.assertEqual(len(set(handlers.__all__)), len(handlers.__all__))
+
+    def test_names_are_handlers(self):
+        for name in handlers.__all__:
+            self.assertTrue(
+                issubclass(getattr(handlers, name), Handler),
+                "%s is not a Handler." % name,
+            )
+
+    def test_exports_every_concrete_handler(self):
+        for module_info in iter_modules(handlers.__path__):
+            module = import_module(
+                "%s.%s" % (handlers.__name__, module_info.name)
+            )
+            for name, obj in vars(module).items():
+                if (
+                    isclass(obj)
+                    and issubclass(obj, Handler)
+                    and obj.__module__ == module.__name__
+                    and not obj._meta.abstract
+                ):
+                    self.assertIn(name, handlers.__all__)
@@ -19,6 +19,7 @@ __all__ = [
     "ip_range_within_network",
 ]
 
+from bisect import bisect_right
 import codecs
 from collections import namedtuple
 from operator import attrgetter
@@ -413,6 +414,9 @@ class MAASIPSet(set):
         self.ranges = _normalize_ipranges(self.ranges)
         self.ranges = _combine_overlapping_maasipranges(self.ranges)
         self.ranges = _coalesce_adjacent_purposes(self.ranges)
+        # The condensed ranges do not overlap, so `find()` can bisect on
+        # their first addresses rather than scanning every range.
+        self._firsts = [item.first for item in self.ranges]
 
     def __ior__(self, other):
         """Return self |= other."""
@@ -426,23 +430,18 @@ class MAASIPSet(set):
     def find(self, search) -> Optional[MAASIPRange]:
         """Searches the list of IPRange objects until it finds the specified
         search parameter, and returns the range it belongs to if found.
-        (If the search parameter is a range, returns the result based on
-        matching the searching for the range containing the first IP address
-        within that range.)
+        (If the search parameter is a range, returns the range containing
+        every IP address within that range.)
         """
         if isinstance(search, IPRange):
-            for item in self.ranges:
-                if (
-                    item.first <= search.first <= item.last
-                    and item.first <= search.last <= item.last
-                ):
-                    return item
+            first, last = search.first, search.last
         else:
-            addr = IPAddress(search)
-            addr = int(addr)
-            for item in self.ranges:
-                if item.first <= addr <= item.last:
-                    return item
+            first = last = int(IPAddress(search))
+        index = bisect_right(self._firsts, first) - 1
+        if index >= 0:
+            item = self.ranges[index]
+            if first <= item.last and last <= item.last:
+                return item
         return None
 
     @property
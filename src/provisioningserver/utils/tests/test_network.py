@@ -683,6 +683,31 @@ class TestMAASIPSet(MAASTestCase):
         self.assertThat(s, Not(Contains(IPRange("10.0.0.99", "10.0.0.254"))))
         self.assertThat(s, Not(Contains("10.0.0.255")))
 
+    def test__find_returns_containing_range(self):
+        range1 = make_iprange("10.0.0.1", "10.0.0.100", purpose="DNS")
+        range2 = make_iprange("10.0.0.150", "10.0.0.199", purpose="DHCP")
+        range3 = make_iprange("10.0.0.200", "10.0.0.254", purpose="unused")
+        s = MAASIPSet([range3, range1, range2])
+        self.assertEqual(range1, s.find("10.0.0.1"))
+        self.assertEqual(range1, s.find("10.0.0.100"))
+        self.assertEqual(range2, s.find("10.0.0.150"))
+        self.assertEqual(range3, s.find("10.0.0.254"))
+        self.assertEqual(range2, s.find(IPRange("10.0.0.160", "10.0.0.170")))
+        self.assertIsNone(s.find("10.0.0.0"))
+        self.assertIsNone(s.find("10.0.0.101"))
+        self.assertIsNone(s.find("10.0.0.255"))
+        self.assertIsNone(s.find(IPRange("10.0.0.190", "10.0.0.210")))
+
+    def test__find_sees_ranges_added_with_ior(self):
+        s = MAASIPSet([make_iprange("10.0.0.100", "10.0.0.199")])
+        s |= MAASIPSet([make_iprange("10.0.0.1", "10.0.0.50")])
+        self.assertEqual(
+            make_iprange("10.0.0.1", "10.0.0.50"), s.find("10.0.0.25")
+        )
+        self.assertEqual(
+            make_iprange("10.0.0.100", "10.0.0.199"), s.find("10.0.0.150")
+        )
+
     def test__normalizes_range(self):
         addr1 = "10.0.0.1"
         addr2 = IPAddress("10.0.0.2")